@@ -1,11 +1,19 @@
 import os
+import re
+import errno
 import sys
+import json
+import time
 import shutil
+import tempfile
+import zipfile
+import threading
 import traceback
 import argostranslate.translate as T
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from PyQt5 import QtCore, QtWidgets
-from argostranslate.package import install_from_path
+from argostranslate import settings as argos_settings
 
 
 def get_base_dir():
@@ -23,43 +31,224 @@ os.makedirs(models_dir, exist_ok=True)  # optional safety
 # Now your existing argostranslate.* calls work as before
 
 
+def _env_int(name, default, minimum=1):
+    """Integer setting from the environment; bad or too-small values use default."""
+    try:
+        value = int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        print(f"Ignoring invalid {name}={os.environ.get(name)!r}; using {default}")
+        return default
+    return value if value >= minimum else default
+
+
+# How many .argosmodel archives to unpack at once (disk-bound, not CPU-bound)
+MODEL_INSTALL_WORKERS = _env_int("GBT_INSTALL_WORKERS", 4)
+
+# Local scratch space for "stage on local disk" runs (inputs on network shares)
+SCRATCH_DIR = os.environ.get("GBT_SCRATCH_DIR") or os.path.join(
+    tempfile.gettempdir(), "GUIBatchTranslator"
+)
+SCRATCH_MAX_MB = _env_int("GBT_SCRATCH_MAX_MB", 4096)
+# Input copy + English pivot file + final output can all be in scratch at once
+_SCRATCH_OVERHEAD = 3
+# job-* folders untouched for this long were left behind by a crashed run
+_SCRATCH_STALE_SECS = 12 * 3600
+
+# Extra pass-through regexes, one per line (see load_passthrough_patterns)
+PASSTHROUGH_FILE = os.environ.get("GBT_PASSTHROUGH_FILE") or os.path.join(
+    base_dir, "passthrough_patterns.txt"
+)
+
+
+def _version_key(v):
+    return tuple(int(x) for x in re.findall(r"\d+", str(v or "")))
+
+
+def _read_argosmodel_metadata(path):
+    """
+    Check a .argosmodel archive's layout and read its metadata.json only; member
+    CRCs are verified later by extractall, so skipped packages stay cheap.
+    Returns (top_level_dir_name, metadata_dict); raises on a bad archive.
+    """
+    if not zipfile.is_zipfile(path):
+        raise RuntimeError("Not a valid Argos Model (must be a zip archive)")
+    with zipfile.ZipFile(path, "r") as zipf:
+        names = zipf.namelist()
+        tops = {n.replace("\\", "/").split("/", 1)[0] for n in names}
+        if len(tops) != 1 or any(
+            n.startswith(("/", "\\")) or ".." in n.replace("\\", "/").split("/")
+            for n in names
+        ):
+            raise RuntimeError("Archive must contain exactly one package folder.")
+        top = tops.pop()
+        try:
+            meta = json.loads(zipf.read(f"{top}/metadata.json").decode("utf-8"))
+        except KeyError:
+            raise RuntimeError("Archive has no metadata.json.") from None
+        if not meta.get("from_code") or not meta.get("to_code"):
+            raise RuntimeError("metadata.json is missing from_code/to_code.")
+    return top, meta
+
+
+def _installed_package_dirs(pkg_dir):
+    """
+    Map (from_code, to_code) -> [(version, path), ...] for packages already in
+    pkg_dir, highest version first (older installs may have left several).
+    """
+    found = {}
+    for d in Path(pkg_dir).iterdir():
+        mpath = d / "metadata.json"
+        if not mpath.is_file():
+            continue
+        try:
+            meta = json.loads(mpath.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        found.setdefault((meta.get("from_code"), meta.get("to_code")), []).append(
+            (meta.get("package_version"), d)
+        )
+    for dirs in found.values():
+        dirs.sort(key=lambda vd: _version_key(vd[0]), reverse=True)
+    return found
+
+
+# One lock per (from_code, to_code) so two archives for the same pair never race
+_pair_locks = {}
+_pair_locks_guard = threading.Lock()
+
+
+def _pair_lock(pair):
+    with _pair_locks_guard:
+        return _pair_locks.setdefault(pair, threading.Lock())
+
+
+def install_argosmodel_verified(path):
+    """
+    Install one .argosmodel without argos' global package lock so several can run
+    in parallel. The archive layout and version are checked first, then it is
+    extracted (CRC-checked) into a staging folder next to the packages dir and
+    only then renamed into place.
+    Returns "installed", or "skipped" if the same or a newer version is installed.
+    """
+    top, meta = _read_argosmodel_metadata(path)
+    pkg_dir = Path(argos_settings.package_data_dir)
+    pkg_dir.mkdir(parents=True, exist_ok=True)
+
+    pair = (meta["from_code"], meta["to_code"])
+    with _pair_lock(pair):
+        return _install_staged(path, top, meta, pkg_dir, pair)
+
+
+def _install_staged(path, top, meta, pkg_dir, pair):
+    existing = _installed_package_dirs(pkg_dir).get(pair, [])
+    if existing and _version_key(existing[0][0]) >= _version_key(
+        meta.get("package_version")
+    ):
+        return "skipped"
+
+    # Stage outside pkg_dir (argos treats every sub-folder there as a package)
+    # but on the same volume so the final rename is atomic.
+    staging = Path(tempfile.mkdtemp(prefix=".argos-staging-", dir=pkg_dir.parent))
+    try:
+        with zipfile.ZipFile(path, "r") as zipf:
+            zipf.extractall(path=staging)  # raises BadZipFile on a CRC mismatch
+        if not (staging / top / "metadata.json").is_file():
+            raise RuntimeError("Extracted package has no metadata.json.")
+        dest = pkg_dir / top
+        old = staging / (top + ".old")
+        if dest.exists():
+            os.replace(dest, old)
+        try:
+            os.replace(staging / top, dest)
+        except OSError:
+            # Put the previous version back rather than leave the pair empty
+            if old.exists():
+                os.replace(old, dest)
+            raise
+        for _, d in existing:
+            if d != dest and d.exists():
+                shutil.rmtree(d, ignore_errors=True)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return "installed"
+
+
 class _PathInstallWorker(QtCore.QObject):
     progress = QtCore.pyqtSignal(str)
+    step = QtCore.pyqtSignal(int)  # packages handled so far
     finished = QtCore.pyqtSignal(bool)
 
-    def __init__(self, items, install_one_callable):
+    def __init__(self, items, install_one_callable, max_workers=1):
         super().__init__()
         self._items = list(items)
         self._install_one = install_one_callable
+        self._max_workers = max(1, int(max_workers))
         self._cancelled = False
 
+    def _timed_install(self, path):
+        t0 = time.perf_counter()
+        status = self._install_one(path) or "installed"
+        return status, time.perf_counter() - t0
+
     @QtCore.pyqtSlot()
     def run(self):
         total = len(self._items)
-        for i, path in enumerate(self._items, start=1):
-            if self._cancelled:
-                self.finished.emit(False)
-                return
-            name = os.path.basename(path)
-            self.progress.emit(f"Installing {name}… ({i}/{total})")
-            try:
-                self._install_one(path)
-            except Exception as e:
-                self.progress.emit(f"Error installing {name}: {e}")
-                self.finished.emit(False)
-                return
-        self.progress.emit("All language packages installed.")
-        self.finished.emit(True)
+        t_start = time.perf_counter()
+        done = failed = 0
+        counts = {}
+        self.progress.emit(
+            f"Installing {total} package(s), {self._max_workers} at a time…"
+        )
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            futures = {pool.submit(self._timed_install, p): p for p in self._items}
+            for fut in as_completed(futures):
+                if self._cancelled:
+                    for f in futures:
+                        f.cancel()
+                name = os.path.basename(futures[fut])
+                try:
+                    status, secs = fut.result()
+                except CancelledError:
+                    continue
+                except Exception as e:
+                    done += 1
+                    failed += 1
+                    self.progress.emit(f"Error installing {name}: {e} ({done}/{total})")
+                    self.step.emit(done)
+                    continue
+                done += 1
+                counts[status] = counts.get(status, 0) + 1
+                self.progress.emit(f"{name}: {status} in {secs:.1f}s ({done}/{total})")
+                self.step.emit(done)
+
+        if self._cancelled:
+            self.finished.emit(False)
+            return
+        summary = ", ".join(f"{n} {k}" for k, n in sorted(counts.items()))
+        if failed:
+            summary = f"{summary}, {failed} failed" if summary else f"{failed} failed"
+        self.progress.emit(
+            f"Language packages done: {summary} "
+            f"({time.perf_counter() - t_start:.1f}s)."
+        )
+        self.finished.emit(failed == 0)
 
     def cancel(self):
         self._cancelled = True
 
 
 def _run_path_installs_with_popup(
-    parent, paths, install_one_callable, title="Installing language packs"
+    parent,
+    paths,
+    install_one_callable,
+    title="Installing language packs",
+    max_workers=MODEL_INSTALL_WORKERS,
+    on_progress=None,
 ):
     """
-    Show a modal QProgressDialog and run install_one_callable(path) on a worker thread.
+    Show a modal QProgressDialog and run install_one_callable(path) on a worker thread,
+    up to max_workers paths at a time. A failing path does not stop the others.
+    on_progress(str), if given, also receives every per-package status line.
     Returns True if dialog wasn't cancelled (installs attempted to completion).
     """
     if not paths:
@@ -70,14 +259,18 @@ def _run_path_installs_with_popup(
     dlg.setWindowModality(QtCore.Qt.ApplicationModal)
     dlg.setAutoClose(False)
     dlg.setAutoReset(False)
-    dlg.setRange(0, 0)  # indeterminate
+    dlg.setRange(0, len(paths))
+    dlg.setValue(0)
     dlg.setMinimumWidth(420)
 
     thread = QtCore.QThread(parent)
-    worker = _PathInstallWorker(paths, install_one_callable)
+    worker = _PathInstallWorker(paths, install_one_callable, max_workers)
     worker.moveToThread(thread)
 
     worker.progress.connect(dlg.setLabelText)
+    worker.step.connect(dlg.setValue)
+    if on_progress is not None:
+        worker.progress.connect(on_progress)
     worker.finished.connect(lambda _ok: dlg.done(0))
     thread.started.connect(worker.run)
 
@@ -222,8 +415,10 @@ def ensure_bundled_models_installed(parent=None):
     installed_any = []
 
     def _install_one(path):
-        install_from_path(path)
-        installed_any.append(path)
+        status = install_argosmodel_verified(path)
+        if status == "installed":
+            installed_any.append(path)
+        return status
 
     # Show the modal "Installing…" while we process the files
     _run_path_installs_with_popup(
@@ -239,6 +434,128 @@ def ensure_bundled_models_installed(parent=None):
     return installed_any
 
 
+# Text that fully matches one of these (after strip) is never sent to the model.
+# Anything without a single letter (numbers, amounts, dates, times) is skipped too.
+PASSTHROUGH_PATTERNS = [
+    re.compile(p)
+    for p in (
+        r"(?:https?://|ftp://|www\.)\S+",  # URLs
+        r"mailto:\S+|[\w.+-]+@[\w-]+(?:\.[\w-]+)+",  # e-mail addresses
+        r"[A-Za-z]:\\\S*|\\\\\S+|/(?:[\w.-]+/)+[\w.-]*",  # file paths
+        r"\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}[T ]\d{1,2}:\d{2}(?::\d{2})?\w*",  # timestamps
+    )
+]
+_ID_TOKEN = re.compile(r"[\w./#:-]+")
+_HEX_ID = re.compile(r"[0-9a-f]{8,}|[0-9a-f]+(?:-[0-9a-f]+){2,}")  # hashes, GUIDs
+# A text counts as code only if every line has code *structure* (assignment,
+# call, block header, import...); punctuation alone is not enough. Free text
+# after an operator ("Discount = 10% for members;") never counts.
+_NO_PROSE = r"(?!.*\b(?!new\b)[A-Za-z]{2,}\s+[A-Za-z]{2,}\b)"
+_CODE_MARK = r"(?=.*(?:[\d()\[\]\"'_]|\.\w|::|->))"
+_LVALUE = r"[A-Za-z_$][\w$]*(?:(?:\.|->|::)[A-Za-z_$][\w$]*|\[[^\]]*\])*"
+_CODE_LINE = re.compile(
+    r"\s*(?:[})\]][;,)]*"
+    # x = 1;  a[i] += b;  i++;  foo.bar(1);  std::cout << x;  return x;
+    rf"|{_NO_PROSE}{_CODE_MARK}{_LVALUE}\s*(?:[-+*/%|&^]?=(?!=)|<<|>>)\s*[^;]+;"
+    rf"|{_LVALUE}(?:\+\+|--);"
+    r"|(?:[\w$]+(?:\.|::|->))*[\w$]+\(.*\)\s*;"
+    r"|(?:break|continue|return);"
+    rf"|(?:return|throw)\s+{_NO_PROSE}{_CODE_MARK}[^;]+;"
+    # if (a == b) {   } else {   } catch (e) {   public void run(int x) {
+    r"|(?:}\s*)?(?:else|try|(?:else\s+)?(?:if|for|while|switch|catch)\s*\(.*\))\s*\{"
+    r"|(?:[\w$.<>\[\]]+\s+){0,3}[\w$.]+\([^()]*\)\s*(?:=>\s*)?\{"
+    r"|class\s+\w+(?:\s+(?:extends|implements)\s+[\w.]+(?:\s*,\s*[\w.]+)*)?\s*\{"
+    # Python: def f(x):  class Foo(Base):  if x == 1:  return x + 1
+    r"|def\s+\w+\s*\(.*\)\s*(?:->\s*[\w.\[\], ]+)?:"
+    r"|class\s+\w+\s*\([^)]*\)\s*:"
+    r"|(?:if|elif|while)\s+.*(?:==|!=|<=|>=).*:"
+    r"|return\s+[\w.]+(?:\s*[-+*/%]\s*\w+|\(.*\)|\[.*\])"
+    # const f = (a) => a * 2;  let n = 0  x := 5
+    rf"|(?:const|let|var)\s+\w+\s*={_NO_PROSE}.+"
+    rf"|\w+\s*:={_NO_PROSE}.+"
+    r"|#include\s*[<\"].*"
+    r"|import\s+\w+(?:\.\w+)+;?|from\s+[\w.]+\s+import\s+.+"
+    # SELECT *|a, b|count(x) FROM t   (not "SELECT ONE OPTION FROM THE LIST")
+    r"|SELECT\s+(?:DISTINCT\s+)?(?:\*|[\w.]+(?:\s*,\s*[\w.]+)+|\w+\([^)]*\))"
+    r"\s+FROM\s+[\w.]+.*)"
+)
+
+# Counts across a run; the Worker reports the difference per file
+PREFILTER_STATS = {"model_calls": 0, "skipped": 0}
+
+
+def load_passthrough_patterns(path=PASSTHROUGH_FILE):
+    """Add user regexes (one per line, '#' starts a comment) to PASSTHROUGH_PATTERNS."""
+    if not os.path.isfile(path):
+        return 0
+    added = 0
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                PASSTHROUGH_PATTERNS.append(re.compile(line))
+                added += 1
+            except re.error as e:
+                print(f"Ignoring bad pass-through pattern {line!r}: {e}")
+    return added
+
+
+load_passthrough_patterns()
+
+
+def _looks_like_identifier(s):
+    """
+    One token with no lower-case letters, at least as many digits as letters,
+    and either 4+ digits ('ORD2024', 'AB1234') or a separator and 2+ digits
+    ('SKU-4411-B', 'A-12'); or a lower-case hex hash/GUID with 2+ digits.
+    Short codes and unit words ('Q3', '5G', 'F1', '10kg', '100th') are not.
+    """
+    if not _ID_TOKEN.fullmatch(s):
+        return False
+    digits = sum(ch.isdigit() for ch in s)
+    letters = sum(ch.isalpha() for ch in s)
+    if digits < 2:
+        return False
+    if any(ch.islower() for ch in s):
+        return bool(_HEX_ID.fullmatch(s))
+    has_sep = any(ch in "./#:-_" for ch in s)
+    return digits >= letters and (digits >= 4 or has_sep)
+
+
+def is_untranslatable(text):
+    """True for text a model would only echo back: numbers, IDs, URLs, code…"""
+    if not isinstance(text, str):
+        return False
+    s = text.strip()
+    if not any(ch.isalpha() for ch in s):
+        return True
+    if _looks_like_identifier(s):
+        return True
+    if any(p.fullmatch(s) for p in PASSTHROUGH_PATTERNS):
+        return True
+    return all(_CODE_LINE.fullmatch(l) for l in s.splitlines() if l.strip())
+
+
+class _PrefilteredTranslation:
+    """Wraps an argos translation so untranslatable text never reaches the model."""
+
+    def __init__(self, translation):
+        self._translation = translation
+
+    def translate(self, text):
+        if is_untranslatable(text):
+            PREFILTER_STATS["skipped"] += 1
+            return text
+        PREFILTER_STATS["model_calls"] += 1
+        return self._translation.translate(text)
+
+    def __getattr__(self, name):
+        # argos-translate-files also reads to_lang/from_lang
+        return getattr(self._translation, name)
+
+
 def get_lang_by_code(code):
     for l in T.get_installed_languages():
         if l.code == code:
@@ -252,9 +569,10 @@ def get_translation_or_none(src_code, dst_code):
     if not src or not dst:
         return None
     try:
-        return src.get_translation(dst)
+        tr = src.get_translation(dst)
     except Exception:
         return None
+    return _PrefilteredTranslation(tr) if tr else None
 
 
 def translate_text_direct(tr, text: str) -> str:
@@ -408,50 +726,325 @@ def translate_with_optional_pivot(in_path, src_code, dst_code, out_dir):
 
 
 def move_to_dir(path, out_dir):
-    """Move translated file to chosen output directory (keeping basename)."""
+    """
+    Move translated file to chosen output directory (keeping basename).
+    The destination only ever appears complete: same-volume moves are a plain
+    rename, cross-volume moves copy to a hidden temp file in out_dir first.
+    """
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     path = Path(path)
     dest = out_dir / path.name
-    if str(path) != str(dest):
-        if dest.exists():
-            dest.unlink()
-        shutil.move(str(path), str(dest))
+    if str(path) == str(dest):
+        return str(dest)
+    try:
+        os.replace(path, dest)
+    except OSError as e:
+        # Only a different drive/share gets the copy fallback (ERROR_NOT_SAME_DEVICE
+        # is winerror 17); a locked or read-only dest would just fail again.
+        if e.errno != errno.EXDEV and getattr(e, "winerror", None) != 17:
+            raise
+        # Stage next to dest, then rename over it
+        fd, tmp = tempfile.mkstemp(
+            prefix=f".{path.name}.", suffix=".partial", dir=out_dir
+        )
+        os.close(fd)
+        try:
+            shutil.copyfile(path, tmp)
+            os.replace(tmp, dest)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        path.unlink()
     return str(dest)
 
 
+def clear_stale_scratch(scratch_dir=SCRATCH_DIR, max_age=_SCRATCH_STALE_SECS):
+    """Remove job-* folders a killed run left in scratch_dir. Returns how many."""
+    if not os.path.isdir(scratch_dir):
+        return 0
+    cutoff = time.time() - max_age
+    removed = 0
+    for d in Path(scratch_dir).glob("job-*"):
+        try:
+            if d.is_dir() and d.stat().st_mtime < cutoff:
+                shutil.rmtree(d, ignore_errors=True)
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def scratch_has_room(in_path, max_mb=SCRATCH_MAX_MB):
+    """
+    True if staging in_path stays under the scratch size cap. Files are staged
+    one at a time and each job folder is removed afterwards, so a run's usage is
+    just the current job.
+    """
+    need = os.path.getsize(in_path) * _SCRATCH_OVERHEAD
+    return need <= max_mb * 1024 * 1024
+
+
+def translate_via_scratch(
+    in_path, src_code, dst_code, out_dir, scratch_dir=SCRATCH_DIR
+):
+    """
+    Copy in_path to local scratch, do all translation (and pivot) work there and
+    commit only the final file to out_dir. Returns final output path.
+    """
+    os.makedirs(scratch_dir, exist_ok=True)
+    work = tempfile.mkdtemp(prefix="job-", dir=scratch_dir)
+    try:
+        local_in = os.path.join(work, os.path.basename(in_path))
+        shutil.copyfile(in_path, local_in)
+        local_out = translate_with_optional_pivot(
+            local_in, src_code, dst_code, os.path.join(work, "out")
+        )
+        return move_to_dir(local_out, out_dir)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+# Pre-scan heuristics: all estimates are in rough characters of translatable text
+_MARKUP_TEXT_RATIO = 0.25  # share of XML/HTML bytes that is actual text
+_XLS_TEXT_RATIO = 0.3  # share of a BIFF .xls that is string data
+_PDF_CHARS_PER_PAGE = 2000
+_PDF_BYTES_PER_PAGE = 50_000  # used when the page count can't be found
+_PDF_SCAN_BYTES = 1 << 20
+# Rate used for the ETA until the first file finishes, and the tick interval
+_DEFAULT_CHARS_PER_SEC = 300
+_ETA_TICK_SECS = 1.0
+_CHARS_PER_CELL = 24  # average string cell, for the sharedStrings count
+# Zip members holding the document text; styles, themes, fonts are ignored
+_CONTENT_PARTS = {
+    ".docx": re.compile(r"word/document\.xml"),
+    ".pptx": re.compile(r"ppt/slides/slide\d+\.xml"),
+    ".odt": re.compile(r"content\.xml"),
+    ".odp": re.compile(r"content\.xml"),
+    ".epub": re.compile(r".*\.x?html?", re.IGNORECASE),
+}
+
+# Label -> ordering key used by order_jobs()
+JOB_ORDERS = {
+    "As listed": None,
+    "Smallest first": "smallest",
+    "Largest first": "largest",
+}
+
+
+def _pdf_page_count(path):
+    """Read /Count from the page tree in the first/last MB of the file, or None."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as fh:
+        head = fh.read(_PDF_SCAN_BYTES)
+        tail = b""
+        if size > _PDF_SCAN_BYTES:
+            fh.seek(max(_PDF_SCAN_BYTES, size - _PDF_SCAN_BYTES))
+            tail = fh.read()
+    counts = [
+        int(m)
+        for m in re.findall(rb"/Type\s*/Pages\b[^>]*?/Count\s+(\d+)", head + tail)
+    ]
+    counts += [
+        int(m)
+        for m in re.findall(rb"/Count\s+(\d+)[^>]*?/Type\s*/Pages\b", head + tail)
+    ]
+    return max(counts) if counts else None
+
+
+def estimate_work(path):
+    """
+    Cheap estimate of how much text a file holds (in characters), used to order
+    jobs and weight progress. Only reads zip directories, the sharedStrings
+    header or a small byte range; for zips only the content parts count.
+    """
+    ext = Path(path).suffix.lower()
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return 1
+    try:
+        if ext == ".xlsx":
+            with zipfile.ZipFile(path) as z:
+                names = set(z.namelist())
+                if "xl/sharedStrings.xml" in names:
+                    # <sst ... count="N"> = number of string cells in the book
+                    with z.open("xl/sharedStrings.xml") as fh:
+                        m = re.search(rb'\bcount="(\d+)"', fh.read(1024))
+                    if m:
+                        return max(1, int(m.group(1)) * _CHARS_PER_CELL)
+                    strings = z.getinfo("xl/sharedStrings.xml").file_size
+                else:
+                    # Inline strings live in the sheets themselves
+                    strings = sum(
+                        i.file_size
+                        for i in z.infolist()
+                        if i.filename.startswith("xl/worksheets/")
+                        and i.filename.endswith(".xml")
+                    )
+            return max(1, int(strings * _MARKUP_TEXT_RATIO))
+        elif ext == ".xls":
+            return max(1, int(size * _XLS_TEXT_RATIO))
+        elif ext in _CONTENT_PARTS:
+            with zipfile.ZipFile(path) as z:
+                markup = sum(
+                    i.file_size
+                    for i in z.infolist()
+                    if _CONTENT_PARTS[ext].fullmatch(i.filename)
+                )
+            return max(1, int(markup * _MARKUP_TEXT_RATIO))
+        elif ext in {".html", ".htm"}:
+            return max(1, int(size * _MARKUP_TEXT_RATIO))
+        elif ext == ".pdf":
+            pages = _pdf_page_count(path) or max(1, size // _PDF_BYTES_PER_PAGE)
+            return pages * _PDF_CHARS_PER_PAGE
+    except Exception:
+        pass
+    return max(1, size)
+
+
+def order_jobs(files, work, order=None):
+    """Return files sorted by estimated work ("smallest"/"largest"), or as given."""
+    if order == "smallest":
+        return sorted(files, key=lambda f: work[f])
+    if order == "largest":
+        return sorted(files, key=lambda f: work[f], reverse=True)
+    return list(files)
+
+
+def format_eta(seconds):
+    seconds = max(0, int(round(seconds)))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
 class Worker(QtCore.QObject):
     progress = QtCore.pyqtSignal(int, str)  # percent, message
+    eta = QtCore.pyqtSignal(int, str)  # percent, ETA text (not logged)
     file_done = QtCore.pyqtSignal(str, str)  # input_path, output_path
     error = QtCore.pyqtSignal(str, str)  # input_path, error_message
     finished = QtCore.pyqtSignal()
 
-    def __init__(self, files, src_code, dst_code, out_dir):
+    def __init__(
+        self, files, src_code, dst_code, out_dir, scratch_dir=None, order=None
+    ):
         super().__init__()
         self.files = files
         self.src = src_code
         self.dst = dst_code
         self.out_dir = out_dir
+        self.scratch_dir = scratch_dir  # None = translate next to the input
+        self.order = order  # see JOB_ORDERS
         self._abort = False
 
     @QtCore.pyqtSlot()
     def run(self):
         total = len(self.files)
-        for idx, f in enumerate(self.files, 1):
+        stats_before = dict(PREFILTER_STATS)
+        if self.scratch_dir:
+            stale = clear_stale_scratch(self.scratch_dir)
+            if stale:
+                self.progress.emit(0, f"Removed {stale} stale scratch folder(s).")
+        self.progress.emit(0, f"Estimating work for {total} file(s)…")
+        work = {f: estimate_work(f) for f in self.files}
+        files = order_jobs(self.files, work, self.order)
+        # Over the list, not the dict: the same path may be queued more than once
+        total_work = sum(work[f] for f in files) or 1
+        # Shared with the ETA ticker thread; throughput is measured on
+        # successfully translated files only
+        st = {
+            "total": total_work,
+            "done": 0,
+            "current": 0,
+            "t0": time.perf_counter(),
+            "measured_work": 0,
+            "measured_secs": 0.0,
+        }
+        stop = threading.Event()
+        ticker = threading.Thread(target=self._eta_ticker, args=(stop, st))
+        ticker.daemon = True
+        ticker.start()
+        try:
+            self._run_files(files, work, st)
+        finally:
+            stop.set()
+            ticker.join()
+        skipped = PREFILTER_STATS["skipped"] - stats_before["skipped"]
+        calls = PREFILTER_STATS["model_calls"] - stats_before["model_calls"]
+        if skipped:
+            self.progress.emit(
+                100,
+                f"Pre-filter saved {skipped} of {skipped + calls} model call(s) "
+                f"({skipped / (skipped + calls):.0%}).",
+            )
+        self.progress.emit(100, "Done.")
+        self.finished.emit()
+
+    def _run_files(self, files, work, st):
+        total = len(files)
+        for idx, f in enumerate(files, 1):
             if self._abort:
                 break
+            pct = int(st["done"] / st["total"] * 100)
+            t0 = time.perf_counter()
+            st["current"], st["t0"] = work[f], t0
+            skipped_before = PREFILTER_STATS["skipped"]
             try:
-                msg = f"Translating ({idx}/{total}): {os.path.basename(f)}"
-                self.progress.emit(int((idx - 1) / total * 100), msg)
-                outp = translate_with_optional_pivot(
-                    f, self.src, self.dst, self.out_dir
-                )
+                _, eta = self._estimate_eta(st)
+                msg = f"Translating ({idx}/{total}): {os.path.basename(f)} — ETA {eta}"
+                self.progress.emit(pct, msg)
+                self.eta.emit(pct, eta)
+                if self.scratch_dir and scratch_has_room(f):
+                    outp = translate_via_scratch(
+                        f, self.src, self.dst, self.out_dir, self.scratch_dir
+                    )
+                else:
+                    if self.scratch_dir:
+                        self.progress.emit(
+                            pct,
+                            f"Too large for scratch space, translating in place: {os.path.basename(f)}",
+                        )
+                    outp = translate_with_optional_pivot(
+                        f, self.src, self.dst, self.out_dir
+                    )
+                st["measured_work"] += work[f]
+                st["measured_secs"] += time.perf_counter() - t0
                 self.file_done.emit(f, outp)
+                skipped = PREFILTER_STATS["skipped"] - skipped_before
+                if skipped:
+                    self.progress.emit(
+                        pct, f"  {skipped} model call(s) skipped by pre-filter"
+                    )
             except Exception as e:
                 err = "".join(traceback.format_exception_only(type(e), e)).strip()
                 self.error.emit(f, err)
-        self.progress.emit(100, "Done.")
-        self.finished.emit()
+            st["done"] += work[f]
+            st["current"] = 0
+
+    def _estimate_eta(self, st):
+        """(percent, ETA text) from work done plus the running file's elapsed time."""
+        if st["measured_work"] and st["measured_secs"] > 0:
+            rate = st["measured_work"] / st["measured_secs"]
+        else:
+            rate = _DEFAULT_CHARS_PER_SEC
+        # Credit the running file by elapsed time, but never past 95% of it
+        running = min(st["current"] * 0.95, (time.perf_counter() - st["t0"]) * rate)
+        done = st["done"] + max(0.0, running)
+        pct = min(100, int(done / st["total"] * 100))
+        return pct, format_eta((st["total"] - done) / rate)
+
+    def _eta_ticker(self, stop, st):
+        # Runs on a plain thread: run() blocks the worker's event loop, so a
+        # QTimer there would never fire. Signal emission is thread-safe.
+        while not stop.wait(_ETA_TICK_SECS):
+            if st["current"]:
+                self.eta.emit(*self._estimate_eta(st))
 
     def abort(self):
         self._abort = True
@@ -505,6 +1098,12 @@ class MainWindow(QtWidgets.QMainWindow):
         out_row.addWidget(QtWidgets.QLabel("Output folder:"))
         out_row.addWidget(self.out_dir_edit, 1)
         out_row.addWidget(self.out_dir_btn)
+        self.stage_chk = QtWidgets.QCheckBox("Stage on local disk")
+        self.stage_chk.setToolTip(
+            f"Work in {SCRATCH_DIR} (max {SCRATCH_MAX_MB} MB) and write only the "
+            "finished file to the output folder. Useful for network shares."
+        )
+        out_row.addWidget(self.stage_chk)
 
         # Bottom: run + progress + log
         run_row = QtWidgets.QHBoxLayout()
@@ -513,6 +1112,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.cancel_btn.setEnabled(False)
         self.progress = QtWidgets.QProgressBar()
         self.progress.setValue(0)
+        self.order_combo = QtWidgets.QComboBox()
+        for label, key in JOB_ORDERS.items():
+            self.order_combo.addItem(label, key)
+        self.order_combo.setToolTip("Order files by estimated amount of text")
+        run_row.addWidget(self.order_combo)
         run_row.addWidget(self.run_btn)
         run_row.addWidget(self.cancel_btn)
         run_row.addWidget(self.progress, 1)
@@ -610,11 +1214,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self.log.clear()
 
         self.thread = QtCore.QThread()
-        self.worker = Worker(items, src, dst, out_dir)
+        scratch = SCRATCH_DIR if self.stage_chk.isChecked() else None
+        self.worker = Worker(
+            items, src, dst, out_dir, scratch, self.order_combo.currentData()
+        )
         self.worker.moveToThread(self.thread)
 
         self.thread.started.connect(self.worker.run)
         self.worker.progress.connect(self.on_progress)
+        self.worker.eta.connect(self.on_eta)
         self.worker.file_done.connect(self.on_file_done)
         self.worker.error.connect(self.on_error)
         self.worker.finished.connect(self.on_finished)
@@ -633,6 +1241,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.progress.setValue(pct)
         self.log.append(msg)
 
+    @QtCore.pyqtSlot(int, str)
+    def on_eta(self, pct, eta):
+        self.progress.setValue(pct)
+        self.progress.setFormat(f"%p%  (ETA {eta})")
+
     @QtCore.pyqtSlot(str, str)
     def on_file_done(self, inp, outp):
         self.log.append(f"✔ {os.path.basename(inp)} → {outp}")
@@ -645,21 +1258,27 @@ class MainWindow(QtWidgets.QMainWindow):
     def on_finished(self):
         self.run_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
+        self.progress.setFormat("%p%")
         self.log.append("All done.")
 
     def install_models_dialog(self):
         files, _ = QtWidgets.QFileDialog.getOpenFileNames(
             self, "Select .argosmodel files", "", "Argos models (*.argosmodel)"
         )
-        ok = 0
-        for f in files:
-            try:
-                install_from_path(f)
-                ok += 1
-            except Exception as e:
-                self.log.append(f"Model install failed: {os.path.basename(f)} → {e}")
-        if ok:
-            self.log.append(f"Installed {ok} language package(s).")
+        if not files:
+            return
+        installed = []
+
+        def _install_one(path):
+            status = install_argosmodel_verified(path)
+            if status == "installed":
+                installed.append(path)
+            return status
+
+        _run_path_installs_with_popup(
+            self, files, _install_one, on_progress=self.log.append
+        )
+        if installed:
             self.populate_languages()
 
 
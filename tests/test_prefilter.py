@@ -0,0 +1,93 @@
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("argostranslate")
+
+from GUIBatchTranslator import is_untranslatable  # noqa: E402
+
+MUST_SKIP = [
+    # no letters: numbers, amounts, dates, times
+    "123",
+    "1,234.50 €",
+    "2024-01-05",
+    "12:30",
+    # URLs, e-mail, paths
+    "https://example.com/a?b=1",
+    "www.example.com",
+    "sales@example.com",
+    r"C:\temp\x.txt",
+    "/usr/bin/env",
+    # IDs and SKUs
+    "SKU-4411-B",
+    "ORD2024-0001",
+    "AB1234",
+    "3f2a9c10-8b7d-4e21-9a0c-1d2e3f405060",
+    # code
+    "x = foo(1);",
+    "y = 2;",
+    "i--;",
+    "std::cout << x;",
+    "console.log(x);",
+    "return x.y;",
+    'throw new Error("x");',
+    "const f = (a) => a * 2;",
+    "x := 5",
+    "import os.path",
+    "class Foo(Base):",
+    "class Foo extends Bar {",
+    "SELECT * FROM t",
+    "SELECT id, name FROM users",
+    "if (a == b) {\n  return;\n}",
+    "for (int i = 0; i < n; i++) {\n  total += a[i];\n}",
+    "def foo(x):\n    return x + 1",
+]
+
+MUST_TRANSLATE = [
+    "Hello world",
+    "Chapter 1",
+    "Dear {name},",
+    # words that merely contain a digit
+    "COVID-19",
+    "iPhone15",
+    "Phase-2b",
+    "Step1",
+    "10kg",
+    "100km",
+    "100th",
+    "2nd",
+    "Q3",
+    "F1",
+    "5G",
+    # prose with code-like punctuation
+    "Hello world;",
+    "Hello; world",
+    "Contact: sales;",
+    "Terms && Conditions",
+    "Read this :: now",
+    "Note: A => B",
+    "class A: beginners",
+    "class Economy:",
+    "return home;",
+    "return policy",
+    "return the goods;",
+    "from here to there",
+    "if it is late:",
+    "if you agree (yes) {see below}",
+    "Payment (see below);",
+    "Payment -- due within 30 days;",
+    "Discount = 10% for members;",
+    "Total = price + tax;",
+    "Click >> next;",
+    "SELECT ONE OPTION FROM THE LIST",
+    "the Buyer shall pay the price;\nthe Seller shall deliver;",
+]
+
+
+@pytest.mark.parametrize("text", MUST_SKIP)
+def test_passes_through(text):
+    assert is_untranslatable(text)
+
+
+@pytest.mark.parametrize("text", MUST_TRANSLATE)
+def test_goes_to_model(text):
+    assert not is_untranslatable(text)